@@ -1,7 +1,6 @@
 """pyvantagepro2.device-------------------Allows data query of Davis Vantage Pro2 devices."""
 
 from datetime import datetime, timedelta
-import struct
 
 from pylink import link_from_url
 
@@ -15,6 +14,7 @@ from .parser import (
     pack_datetime,
     pack_dmp_date_time,
     unpack_datetime,
+    unpack_dmp_date_time,
 )
 from .utils import ListDict, cached_property, is_bytes, retry
 
@@ -68,6 +68,16 @@ class VantagePro2:
     ESC = "\x1b"
     OK = "\n\rOK\n\r"
 
+    # device commands, encoded once with their <LF>
+    GETTIME_CMD = b"GETTIME\n"
+    SETTIME_CMD = b"SETTIME\n"
+    LOOP_CMD = b"LOOP 1\n"
+    HILOWS_CMD = b"HILOWS\n"
+    DMPAFT_CMD = b"DMPAFT\n"
+    VER_CMD = b"VER\n"
+    NVER_CMD = b"NVER\n"
+    RXCHECK_CMD = b"RXCHECK\n"
+
     def __init__(self, link) -> None:
         """Initalize."""
 
@@ -142,7 +152,7 @@ class VantagePro2:
         """Returns the current datetime of the console."""
 
         self.wake_up()
-        self.send("GETTIME", self.ACK)
+        self.send(self.GETTIME_CMD, self.ACK)
         data = self.link.read(8)
         if isinstance(data, bytes):
             return unpack_datetime(data)
@@ -152,14 +162,14 @@ class VantagePro2:
         """Set the given `dtime` on the station."""
 
         self.wake_up()
-        self.send("SETTIME", self.ACK)
+        self.send(self.SETTIME_CMD, self.ACK)
         self.send(pack_datetime(dtime), self.ACK)
 
     def get_current_data(self):
         """Returns the real-time data as a `Dict`."""
 
         self.wake_up()
-        self.send("LOOP 1", self.ACK)
+        self.send(self.LOOP_CMD, self.ACK)
         current_data = self.link.read(99)
         if isinstance(current_data, bytes):
             if self.RevB:
@@ -171,7 +181,7 @@ class VantagePro2:
         """Get high/low data."""
 
         self.wake_up()
-        self.send("HILOWS", self.ACK)
+        self.send(self.HILOWS_CMD, self.ACK)
         current_data = self.link.read(436)
         if isinstance(current_data, bytes):
             if self.RevB:
@@ -188,16 +198,19 @@ class VantagePro2:
         """
         generator = self._get_archives_generator(start_date, stop_date)
         archives = ListDict()
-        dates = []
+        dates = set()
         for item in generator:
             if item["Datetime"] not in dates:
                 archives.append(item)
-                dates.append(item["Datetime"])
+                dates.add(item["Datetime"])
         return archives.sorted_by("Datetime")
 
     def _get_archives_generator(self, start_date=None, stop_date=None):
         """Get archive records generator until `start_date` and `stop_date`."""
 
+        if not self.RevB:
+            msg = "Do not support RevA data format"
+            raise NotImplementedError(msg)
         self.wake_up()
         # 2001-01-01 01:01:01
         start_date = start_date or datetime(2001, 1, 1, 1, 1, 1)
@@ -206,7 +219,7 @@ class VantagePro2:
         period = self.archive_period
         minutes = start_date.minute % period  # pyright: ignore[reportOperatorIssue]
         start_date = start_date - timedelta(minutes=minutes)
-        self.send("DMPAFT", self.ACK)
+        self.send(self.DMPAFT_CMD, self.ACK)
         # I think that date_time_crc is incorrect...
         self.link.write(pack_dmp_date_time(start_date))
         # timeout must be at least 2 seconds
@@ -222,62 +235,57 @@ class VantagePro2:
         else:
             self.link.write(self.ACK)
         finish = False
-        r_index = 0
+        # local names for the per-page loop
+        write = self.link.write
+        read_dump_page = self._read_dump_page
+        unpack_page = ArchiveDataParserRevB.unpack_page
         for _i in range(header["Pages"]):
             # Read one dump page
             try:
-                dump = self._read_dump_page()
+                dump = read_dump_page()
             except (BadCRCException, BadDataException):
                 finish = True
                 break
-            # Get the 5 raw records
-            raw_records = dump["Records"]
-            # loop through archive records
-            offsets = zip(range(0, 260, 52), range(52, 261, 52), strict=False)
-            # offsets = [(0, 52), (52, 104), ... , (156, 208), (208, 260)]
-            for offset in offsets:
-                raw_record = raw_records[offset[0] : offset[1]]
-                if self.RevB:
-                    record = ArchiveDataParserRevB(raw_record)
-                else:
-                    msg = "Do not support RevA data format"
-                    raise NotImplementedError(msg)
+            # loop through the 5 archive records, only the ones in the
+            # datetime range are kept
+            selected = []
+            for raw_record, values in unpack_page(dump["Records"]):
                 # verify that record has valid data, and store
-                r_time = record["Datetime"]
+                r_time = unpack_dmp_date_time(values[0], values[1])
                 if r_time is None:
                     finish = True
                     break
                 elif r_time <= stop_date:
                     if start_date < r_time:
                         not_in_range = False
-                        msg = "Record-%.4d - Datetime : %s" % (r_index, r_time)  # noqa: UP031
-                        yield record
+                        selected.append((raw_record, values))
                     else:
                         not_in_range = True
                 else:
                     finish = True
                     break
-                r_index += 1
-            if finish:
-                self.link.write(self.ESC)
-                break
-            elif not_in_range:
-                msg = "Page is not in the datetime range"
-                self.link.write(self.ESC)
-                break
+            # Answer the console before parsing the records, so that it
+            # sends the next page while they are being parsed and consumed.
+            if finish or not_in_range:
+                write(self.ESC)
             else:
-                self.link.write(self.ACK)
+                write(self.ACK)
+            for raw_record, values in selected:
+                yield ArchiveDataParserRevB(raw_record, values)
+            if finish or not_in_range:
+                break
 
     @cached_property
     def archive_period(self):
         """Returns number of minutes in the archive period."""
-        return struct.unpack(b"B", self.read_from_eeprom("2D", 1))[0]
+        return self.read_from_eeprom("2D", 1)[0]
 
     @cached_property
     def timezone(self):
         """Returns timezone offset as string."""
         data = self.read_from_eeprom("14", 3)
-        offset, gmt = struct.unpack(b"HB", data)
+        offset = int.from_bytes(data[:2], "little")
+        gmt = data[2]
         if gmt == 1:
             return "GMT+%.2f" % (offset / 100)
         return "Localtime"
@@ -287,7 +295,7 @@ class VantagePro2:
         """Return the firmware date code."""
 
         self.wake_up()
-        self.send("VER", self.OK)
+        self.send(self.VER_CMD, self.OK)
         data = self.link.read(13)
         return datetime.strptime(data.strip("\n\r"), "%b %d %Y").date()
 
@@ -296,7 +304,7 @@ class VantagePro2:
         """Returns the firmware version as string."""
 
         self.wake_up()
-        self.send("NVER", self.OK)
+        self.send(self.NVER_CMD, self.OK)
         data = self.link.read(6)
         return data.strip("\n\r")
 
@@ -305,15 +313,14 @@ class VantagePro2:
         """Return the Console Diagnostics report. (RXCHECK command)."""
 
         self.wake_up()
-        self.send("RXCHECK", self.OK)
+        self.send(self.RXCHECK_CMD, self.OK)
         data = self.link.read().strip("\n\r").split(" ")
-        data = [int(i) for i in data]
         return {
-            "total_received": data[0],
-            "total_missed": data[1],
-            "resyn": data[2],
-            "max_received": data[3],
-            "crc_errors": data[4],
+            "total_received": int(data[0]),
+            "total_missed": int(data[1]),
+            "resyn": int(data[2]),
+            "max_received": int(data[3]),
+            "crc_errors": int(data[4]),
         }
 
     @retry(tries=3, delay=1)
@@ -1,15 +1,25 @@
 """pyvantagepro2.parser-------------------Allows parsing Vantage Pro2 data."""
 
-from array import array
+from binascii import crc_hqx
 from datetime import datetime
+from functools import lru_cache
 import logging
 import struct
 from zoneinfo import ZoneInfo
 
-from .utils import Dict, binary_to_int, bytes_to_binary, bytes_to_hex, cached_property
+from .utils import Dict, bytes_to_binary, bytes_to_hex, cached_property
 
 _LOGGER = logging.getLogger(__name__)
 
+# CRC appended to the data, most significant byte first
+_CRC_STRUCT = struct.Struct(b">H")
+# DMPAFT DateStamp and TimeStamp
+_DMP_DATE_TIME_STRUCT = struct.Struct(b"<HH")
+# SETTIME / GETTIME second, minute, hour, day, month, year - 1900
+_DATETIME_STRUCT = struct.Struct(b">BBBBBB")
+# "HH:MM" strings of the packed HHMM times, see `LoopDataParserRevB.unpack_time`
+_TIME_STRINGS = tuple(f"{t // 100:02d}:{t % 100:02d}" for t in range(2400))
+
 
 class VantageProCRC:
     """Implements CRC algorithm, necessary for encoding and verifying data from the Davis Vantage Pro unit."""
@@ -277,24 +287,19 @@ class VantageProCRC:
         """Initalize."""
 
         self.data = data
-
-    @cached_property
-    def checksum(self):
-        """Return CRC calc value from raw serial data."""
-
-        crc = 0
-        if isinstance(self.data, bytes):
-            for byte in array("B", bytes(self.data)):
-                crc = self.CRC_TABLE[((crc >> 8) ^ byte)] ^ ((crc & 0xFF) << 8)
-            return crc
-        return None
-
-    @cached_property
+        # CRC calc value from raw serial data: CRC-CCITT (XModem) with a
+        # zero seed, i.e. the same algorithm as `CRC_TABLE`, computed in C
+        # by the standard library.
+        self.checksum = None
+        if isinstance(data, (bytes, bytearray, memoryview)):
+            self.checksum = crc_hqx(data, 0)
+
+    @property
     def data_with_checksum(self):
         """Return packed raw CRC from raw data."""
 
-        checksum = struct.pack(b">H", self.checksum)
-        return b"".join([self.data, checksum])
+        checksum = _CRC_STRUCT.pack(self.checksum)
+        return bytes(self.data) + checksum
 
     def check(self):
         """Perform CRC check on raw serial data, return true if valid.
@@ -307,25 +312,55 @@ class VantageProCRC:
         return False
 
 
+def _array_fields(*fields):
+    """Build an `ARRAY_FIELDS` table from `(key, offset, size)` byte arrays.
+
+    Each entry holds the numbered keys the array is expanded to.
+    """
+
+    return tuple(
+        (key, offset, tuple(f"{key}{i:02d}" for i in range(1, size + 1)))
+        for key, offset, size in fields
+    )
+
+
+@lru_cache(maxsize=32)
+def _compile_format(data_format, order="="):
+    """Return the field names and the compiled `struct.Struct` of `data_format`.
+
+    `data_format` is a tuple of (name, format) pairs. The parser formats are
+    class constants, so each one is compiled only once.
+    """
+
+    fields, format_t = zip(*data_format, strict=False)
+    return fields, struct.Struct(order + "".join(format_t))
+
+
 class DataParser(Dict):
     """Implements a reusable class for working with a binary data structure. It provides a named fields interface, similiar to C structures."""
 
-    def __init__(self, data, data_format, order="=") -> None:
-        """Initalize."""
+    # Byte array fields expanded by `expand_arrays`, see `_array_fields`
+    ARRAY_FIELDS = ()
+
+    def __init__(self, data, data_format, order="=", values=None) -> None:
+        """Initalize.
+
+        :param values: Already unpacked field values of `data`, if any.
+        """
 
         super().__init__()
-        self.fields, format_t = zip(*data_format, strict=False)
+        self.fields, self.struct = _compile_format(tuple(data_format), order)
         self.crc_error = False
         if "CRC" in self.fields:
             self.crc_error = not VantageProCRC(data).check()
-        format_t = str("{}{}".format(order, "".join(format_t)))
-        self.struct = struct.Struct(format=format_t)
         # save raw_bytes
         self.raw_bytes = data
         # Unpacks data from `raw_bytes` and returns a dication of named fields
-        data = self.struct.unpack_from(self.raw_bytes, 0)
+        data = values
+        if data is None:
+            data = self.struct.unpack_from(self.raw_bytes, 0)
         self["Datetime"] = None
-        self.update(Dict(zip(self.fields, data, strict=False)))
+        self.update(zip(self.fields, data, strict=False))
 
     @cached_property
     def raw(self):
@@ -340,6 +375,18 @@ class DataParser(Dict):
             self["%s%.2d" % (key, i + 1)] = value  # noqa: UP031
         del self[key]
 
+    def expand_arrays(self):
+        """Replace the `ARRAY_FIELDS` byte arrays with numbered keys.
+
+        Iterating the bytes gives the values, less the field offset.
+        """
+
+        for key, offset, names in self.ARRAY_FIELDS:
+            values = self.pop(key)
+            if offset:
+                values = [value - offset for value in values]
+            self.update(zip(names, values, strict=True))
+
     def __unicode__(self):
         """Unicode."""
 
@@ -364,17 +411,15 @@ class HiLowParser(Dict):
         """Initalize."""
 
         super().__init__()
-        self.fields, format_t = zip(*data_format, strict=False)
+        self.fields, self.struct = _compile_format(tuple(data_format), order)
         self.crc_error = False
         if "CRC" in self.fields:
             self.crc_error = not VantageProCRC(data).check()
-        format_t = str("{}{}".format(order, "".join(format_t)))
-        self.struct = struct.Struct(format=format_t)
         # save raw_bytes
         self.raw_bytes = data
         # Unpacks data from `raw_bytes` and returns a dication of named fields
         data = self.struct.unpack_from(self.raw_bytes, 0)
-        self.update(Dict(zip(self.fields, data, strict=False)))
+        self.update(zip(self.fields, data, strict=False))
 
     @cached_property
     def raw(self):
@@ -455,127 +500,166 @@ class LoopDataParserRevB(DataParser):
         ("CRC", "H"),
     )
 
+    # Fields stored in hundredths, thousandths... with their divisor
+    SCALES = (
+        ("Barometer", 1000),
+        ("TempIn", 10),
+        ("TempOut", 10),
+        ("RainRate", 100),
+        ("RainStorm", 100),
+        # rain totals
+        ("RainDay", 100),
+        ("RainMonth", 100),
+        ("RainYear", 100),
+        # evapotranspiration totals
+        ("ETDay", 1000),
+        ("ETMonth", 100),
+        ("ETYear", 100),
+    )
+
+    # Alarm keys of the extra temperature/humidity stations 1 to 7, from the
+    # most significant bit, and of the soil/leaf stations 1 to 4, from bit 0
+    # as in the "Soil & Leaf Alarms" table of the LOOP packet
+    ALARM_EX_KEYS = tuple(
+        tuple(
+            f"AlarmEx{i:02d}{name}"
+            for name in ("LowTemp", "HighTemp", "LowHum", "HighHum")
+        )
+        for i in range(1, 8)
+    )
+    ALARM_SOIL_LEAF_KEYS = tuple(
+        tuple(
+            f"Alarm{i:02d}{name}"
+            for name in (
+                "LowLeafWet",
+                "HighLeafWet",
+                "LowSoilMois",
+                "HighSoilMois",
+                "LowLeafTemp",
+                "HighLeafTemp",
+                "LowSoilTemp",
+                "HighSoilTemp",
+            )
+        )
+        for i in range(1, 5)
+    )
+
+    # Fields dropped once decoded, or unused
+    UNUSED_FIELDS = (
+        "AlarmIn",
+        "AlarmRain",
+        "AlarmOut",
+        "AlarmExTempHum",
+        "AlarmSoilLeaf",
+        "LOO",
+        "NextRec",
+        "PacketType",
+        "EOL",
+        "CRC",
+    )
+
+    # Byte arrays, in key order
+    ARRAY_FIELDS = _array_fields(
+        ("ExtraTemps", 0, 7),
+        ("LeafTemps", 0, 4),
+        ("SoilTemps", 0, 4),
+        ("HumExtra", 0, 7),
+        ("LeafWetness", 0, 4),
+        ("SoilMoist", 0, 4),
+    )
+
     def __init__(self, data, dtime) -> None:
         """Initalize."""
 
         super().__init__(data, self.LOOP_FORMAT)
         self["Datetime"] = dtime
-        self["Barometer"] = self["Barometer"] / 1000
-        self["TempIn"] = self["TempIn"] / 10
-        self["TempOut"] = self["TempOut"] / 10
-        self["RainRate"] = self["RainRate"] / 100
-        self["RainStorm"] = self["RainStorm"] / 100
+        for key, divisor in self.SCALES:
+            self[key] = self[key] / divisor
         # Given a packed storm date field, unpack and return date
         self["StormStartDate"] = self.unpack_storm_date()
-        # rain totals
-        self["RainDay"] = self["RainDay"] / 100
-        self["RainMonth"] = self["RainMonth"] / 100
-        self["RainYear"] = self["RainYear"] / 100
-        # evapotranspiration totals
-        self["ETDay"] = self["ETDay"] / 1000
-        self["ETMonth"] = self["ETMonth"] / 100
-        self["ETYear"] = self["ETYear"] / 100
         # battery statistics
         self["BatteryVolts"] = self["BatteryVolts"] * 300 / 512 / 100
         # sunrise / sunset
         self["SunRise"] = self.unpack_time(self["SunRise"])
         self["SunSet"] = self.unpack_time(self["SunSet"])
-        # convert to int
-        self["HumExtra"] = struct.unpack(b"7B", self["HumExtra"])
-        self["ExtraTemps"] = struct.unpack(b"7B", self["ExtraTemps"])
-        self["SoilMoist"] = struct.unpack(b"4B", self["SoilMoist"])
-        self["SoilTemps"] = struct.unpack(b"4B", self["SoilTemps"])
-        self["LeafWetness"] = struct.unpack(b"4B", self["LeafWetness"])
-        self["LeafTemps"] = struct.unpack(b"4B", self["LeafTemps"])
 
+        # Alarm bits are read from the most significant bit of each byte,
+        # except the soil/leaf ones
+        raw = self.raw_bytes
         # Inside Alarms bits extraction, only 7 bits are used
-        self["AlarmIn"] = bytes_to_binary(self.raw_bytes[70:71])
-        self["AlarmInFallBarTrend"] = int(self["AlarmIn"][0])
-        self["AlarmInRisBarTrend"] = int(self["AlarmIn"][1])
-        self["AlarmInLowTemp"] = int(self["AlarmIn"][2])
-        self["AlarmInHighTemp"] = int(self["AlarmIn"][3])
-        self["AlarmInLowHum"] = int(self["AlarmIn"][4])
-        self["AlarmInHighHum"] = int(self["AlarmIn"][5])
-        self["AlarmInTime"] = int(self["AlarmIn"][6])
-        del self["AlarmIn"]
+        byte = raw[70]
+        self["AlarmInFallBarTrend"] = (byte >> 7) & 1
+        self["AlarmInRisBarTrend"] = (byte >> 6) & 1
+        self["AlarmInLowTemp"] = (byte >> 5) & 1
+        self["AlarmInHighTemp"] = (byte >> 4) & 1
+        self["AlarmInLowHum"] = (byte >> 3) & 1
+        self["AlarmInHighHum"] = (byte >> 2) & 1
+        self["AlarmInTime"] = (byte >> 1) & 1
         # Rain Alarms bits extraction, only 5 bits are used
-        self["AlarmRain"] = bytes_to_binary(self.raw_bytes[71:72])
-        self["AlarmRainHighRate"] = int(self["AlarmRain"][0])
-        self["AlarmRain15min"] = int(self["AlarmRain"][1])
-        self["AlarmRain24hour"] = int(self["AlarmRain"][2])
-        self["AlarmRainStormTotal"] = int(self["AlarmRain"][3])
-        self["AlarmRainETDaily"] = int(self["AlarmRain"][4])
-        del self["AlarmRain"]
+        byte = raw[71]
+        self["AlarmRainHighRate"] = (byte >> 7) & 1
+        self["AlarmRain15min"] = (byte >> 6) & 1
+        self["AlarmRain24hour"] = (byte >> 5) & 1
+        self["AlarmRainStormTotal"] = (byte >> 4) & 1
+        self["AlarmRainETDaily"] = (byte >> 3) & 1
         # Oustide Alarms bits extraction, only 13 bits are used
-        self["AlarmOut"] = bytes_to_binary(self.raw_bytes[72:73])
-        self["AlarmOutLowTemp"] = int(self["AlarmOut"][0])
-        self["AlarmOutHighTemp"] = int(self["AlarmOut"][1])
-        self["AlarmOutWindSpeed"] = int(self["AlarmOut"][2])
-        self["AlarmOut10minAvgSpeed"] = int(self["AlarmOut"][3])
-        self["AlarmOutLowDewpoint"] = int(self["AlarmOut"][4])
-        self["AlarmOutHighDewPoint"] = int(self["AlarmOut"][5])
-        self["AlarmOutHighHeat"] = int(self["AlarmOut"][6])
-        self["AlarmOutLowWindChill"] = int(self["AlarmOut"][7])
-        self["AlarmOut"] = bytes_to_binary(self.raw_bytes[73])
-        self["AlarmOutHighTHSW"] = int(self["AlarmOut"][0])
-        self["AlarmOutHighSolarRad"] = int(self["AlarmOut"][1])
-        self["AlarmOutHighUV"] = int(self["AlarmOut"][2])
-        self["AlarmOutUVDose"] = int(self["AlarmOut"][3])
-        self["AlarmOutUVDoseEnabled"] = int(self["AlarmOut"][4])
-        del self["AlarmOut"]
-        # AlarmExTempHum bits extraction, only 3 bits are used, but 7 bytes
-        for i in range(1, 8):
-            data = self.raw_bytes[73 + i : 74 + i]
-            self["AlarmExTempHum"] = bytes_to_binary(data)
-            self["AlarmEx%.2dLowTemp" % i] = int(self["AlarmExTempHum"][0])  # noqa: UP031
-            self["AlarmEx%.2dHighTemp" % i] = int(self["AlarmExTempHum"][1])  # noqa: UP031
-            self["AlarmEx%.2dLowHum" % i] = int(self["AlarmExTempHum"][2])  # noqa: UP031
-            self["AlarmEx%.2dHighHum" % i] = int(self["AlarmExTempHum"][3])  # noqa: UP031
-        del self["AlarmExTempHum"]
-        # AlarmSoilLeaf 8bits, 4 bytes
-        for i in range(1, 5):
-            data = self.raw_bytes[81 + i : 82 + i]
-            self["AlarmSoilLeaf"] = bytes_to_binary(data)
-            self["Alarm%.2dLowLeafWet" % i] = int(self["AlarmSoilLeaf"][0])  # noqa: UP031
-            self["Alarm%.2dHighLeafWet" % i] = int(self["AlarmSoilLeaf"][0])  # noqa: UP031
-            self["Alarm%.2dLowSoilMois" % i] = int(self["AlarmSoilLeaf"][0])  # noqa: UP031
-            self["Alarm%.2dHighSoilMois" % i] = int(self["AlarmSoilLeaf"][0])  # noqa: UP031
-            self["Alarm%.2dLowLeafTemp" % i] = int(self["AlarmSoilLeaf"][0])  # noqa: UP031
-            self["Alarm%.2dHighLeafTemp" % i] = int(self["AlarmSoilLeaf"][0])  # noqa: UP031
-            self["Alarm%.2dLowSoilTemp" % i] = int(self["AlarmSoilLeaf"][0])  # noqa: UP031
-            self["Alarm%.2dHighSoilTemp" % i] = int(self["AlarmSoilLeaf"][0])  # noqa: UP031
-        del self["AlarmSoilLeaf"]
-        # delete unused values
-        del self["LOO"]
-        del self["NextRec"]
-        del self["PacketType"]
-        del self["EOL"]
-        del self["CRC"]
-        # Tuple to dict
-        self.tuple_to_dict("ExtraTemps")
-        self.tuple_to_dict("LeafTemps")
-        self.tuple_to_dict("SoilTemps")
-        self.tuple_to_dict("HumExtra")
-        self.tuple_to_dict("LeafWetness")
-        self.tuple_to_dict("SoilMoist")
+        byte = raw[72]
+        self["AlarmOutLowTemp"] = (byte >> 7) & 1
+        self["AlarmOutHighTemp"] = (byte >> 6) & 1
+        self["AlarmOutWindSpeed"] = (byte >> 5) & 1
+        self["AlarmOut10minAvgSpeed"] = (byte >> 4) & 1
+        self["AlarmOutLowDewpoint"] = (byte >> 3) & 1
+        self["AlarmOutHighDewPoint"] = (byte >> 2) & 1
+        self["AlarmOutHighHeat"] = (byte >> 1) & 1
+        self["AlarmOutLowWindChill"] = byte & 1
+        byte = raw[73]
+        self["AlarmOutHighTHSW"] = (byte >> 7) & 1
+        self["AlarmOutHighSolarRad"] = (byte >> 6) & 1
+        self["AlarmOutHighUV"] = (byte >> 5) & 1
+        self["AlarmOutUVDose"] = (byte >> 4) & 1
+        self["AlarmOutUVDoseEnabled"] = (byte >> 3) & 1
+        # AlarmExTempHum bits extraction, only 4 bits are used, but 7 bytes
+        for offset, keys in enumerate(self.ALARM_EX_KEYS, 74):
+            byte = raw[offset]
+            for i, key in enumerate(keys):
+                self[key] = (byte >> (7 - i)) & 1
+        # AlarmSoilLeaf 8bits, 4 bytes, LowLeafWet is bit 0
+        for offset, keys in enumerate(self.ALARM_SOIL_LEAF_KEYS, 82):
+            byte = raw[offset]
+            for i, key in enumerate(keys):
+                self[key] = (byte >> i) & 1
+        # delete the packed alarm bytes and unused values
+        for key in self.UNUSED_FIELDS:
+            del self[key]
+        # Byte arrays to numbered keys
+        self.expand_arrays()
 
     def unpack_storm_date(self):
         """Given a packed storm date field, unpack and return date."""
 
-        date = bytes_to_binary(self.raw_bytes[48:50])
-        date = date[8:16] + date[0:8]
-        year = binary_to_int(date, 0, 7) + 2000
-        day = binary_to_int(date, 7, 12)
-        month = binary_to_int(date, 12, 16)
+        date = int.from_bytes(self.raw_bytes[48:50], "little")
+        year = (date & 0x7F) + 2000  # 7 bits
+        day = (date >> 7) & 0x1F  # 5 bits
+        month = (date >> 12) & 0x0F  # 4 bits
         return f"{year}-{month}-{day}"
 
     def unpack_time(self, time):
         """Given a packed time field, unpack and return "HH:MM" string."""
 
         # format: HHMM, and space padded on the left.ex: "601" is 6:01 AM
+        if 0 <= time < 2400:
+            return _TIME_STRINGS[time]
         return "%02d:%02d" % divmod(time, 100)  # covert to "06:01"  # noqa: UP031
 
 
+# Extra temperature, soil and leaf stations of the HILOWS record
+_HILOW_EXTRA_TEMP_KEYS = tuple(
+    [f"ExtraTemp{i}" for i in range(2, 9)]
+    + [f"Soil{i}" for i in range(1, 5)]
+    + [f"Leaf{i}" for i in range(1, 5)]
+)
+
+
 class HighLowParserRevB(HiLowParser):
     """Parse data returned by the 'LOOP' command. It contains all of the real-time data that can be read from the Davis VantagePro2."""
 
@@ -900,258 +984,111 @@ class HighLowParserRevB(HiLowParser):
         ("YearHiLeafWetness4", "B"),
     )
 
-    def __init__(self, data) -> None:
-        """Initalize."""
-
-        super().__init__(data, self.LOOP_FORMAT)
-        self["DailyLowBarometer"] = self["DailyLowBarometer"] / 1000
-        self["DailyHighBarometer"] = self["DailyHighBarometer"] / 1000
-        self["MonthlyLowBar"] = self["MonthlyLowBar"] / 1000
-        self["MonthlyHighBar"] = self["MonthlyHighBar"] / 1000
-        self["YearLowBarometer"] = self["YearLowBarometer"] / 1000
-        self["YearHighBarometer"] = self["YearHighBarometer"] / 1000
-        self["TimeOfDayLowBar"] = self.unpack_time(self["TimeOfDayLowBar"])
-        self["TimeOfDayHighBar"] = self.unpack_time(self["TimeOfDayHighBar"])
-        self["TimeOfHighWindSpeed"] = self.unpack_time(self["TimeOfHighWindSpeed"])
-        self["DayHiInsideTemp"] = self["DayHiInsideTemp"] / 10
-        self["DayLowInsideTemp"] = self["DayLowInsideTemp"] / 10
-        self["TimeDayHiInTemp"] = self.unpack_time(self["TimeDayHiInTemp"])
-        self["TimeDayLowInTemp"] = self.unpack_time(self["TimeDayLowInTemp"])
-        self["MonthLowInTemp"] = self["MonthLowInTemp"] / 10
-        self["MonthHiInTemp"] = self["MonthHiInTemp"] / 10
-        self["YearLowInTemp"] = self["YearLowInTemp"] / 10
-        self["YearHiInTemp"] = self["YearHiInTemp"] / 10
-        self["TimeDayHiInHum"] = self.unpack_time(self["TimeDayHiInHum"])
-        self["TimeDayLowInHum"] = self.unpack_time(self["TimeDayLowInHum"])
-        self["DayLowOutTemp"] = self["DayLowOutTemp"] / 10
-        self["DayHiOutTemp"] = self["DayHiOutTemp"] / 10
-        self["TimeDayLowOutTemp"] = self.unpack_time(self["TimeDayLowOutTemp"])
-        self["TimeDayHiOutTemp"] = self.unpack_time(self["TimeDayHiOutTemp"])
-        self["MonthHiOutTemp"] = self["MonthHiOutTemp"] / 10
-        self["MonthLowOutTemp"] = self["MonthLowOutTemp"] / 10
-        self["YearHiOutTemp"] = self["YearHiOutTemp"] / 10
-        self["YearLowOutTemp"] = self["YearLowOutTemp"] / 10
-        self["TimeDayLowDewPoint"] = self.unpack_time(self["TimeDayLowDewPoint"])
-        self["TimeDayHiDewPoint"] = self.unpack_time(self["TimeDayHiDewPoint"])
-        self["TimeDayLowChill"] = self.unpack_time(self["TimeDayLowChill"])
-        self["TimeofDayHighHeat"] = self.unpack_time(self["TimeofDayHighHeat"])
-        self["TimeofDayHighTHSW"] = self.unpack_time(self["TimeofDayHighTHSW"])
-        self["TimeofDayHighSolar"] = self.unpack_time(self["TimeofDayHighSolar"])
-        self["TimeofDayHighUV"] = self.unpack_time(self["TimeofDayHighUV"])
-        self["DayHighRainRate"] = self["DayHighRainRate"] / 100
-        self["TimeofDayHighRainRate"] = self.unpack_time(self["TimeofDayHighRainRate"])
-        self["HourHighRainRate"] = self["HourHighRainRate"] / 100
-        self["MonthHighRainRate"] = self["MonthHighRainRate"] / 100
-        self["YearHighRainRate"] = self["YearHighRainRate"] / 100
-        self["DayLowTempExtraTemp2"] = self["DayLowTempExtraTemp2"] / 10
-        self["DayLowTempExtraTemp3"] = self["DayLowTempExtraTemp3"] / 10
-        self["DayLowTempExtraTemp4"] = self["DayLowTempExtraTemp4"] / 10
-        self["DayLowTempExtraTemp5"] = self["DayLowTempExtraTemp5"] / 10
-        self["DayLowTempExtraTemp6"] = self["DayLowTempExtraTemp6"] / 10
-        self["DayLowTempExtraTemp7"] = self["DayLowTempExtraTemp7"] / 10
-        self["DayLowTempExtraTemp8"] = self["DayLowTempExtraTemp8"] / 10
-        self["DayLowTempSoil1"] = self["DayLowTempSoil1"] / 10
-        self["DayLowTempSoil2"] = self["DayLowTempSoil2"] / 10
-        self["DayLowTempSoil3"] = self["DayLowTempSoil3"] / 10
-        self["DayLowTempSoil4"] = self["DayLowTempSoil4"] / 10
-        self["DayLowTempLeaf1"] = self["DayLowTempLeaf1"] / 10
-        self["DayLowTempLeaf2"] = self["DayLowTempLeaf2"] / 10
-        self["DayLowTempLeaf3"] = self["DayLowTempLeaf3"] / 10
-        self["DayLowTempLeaf4"] = self["DayLowTempLeaf4"] / 10
-        self["DayHiTempExtraTemp2"] = self["DayHiTempExtraTemp2"] / 10
-        self["DayHiTempExtraTemp3"] = self["DayHiTempExtraTemp3"] / 10
-        self["DayHiTempExtraTemp4"] = self["DayHiTempExtraTemp4"] / 10
-        self["DayHiTempExtraTemp5"] = self["DayHiTempExtraTemp5"] / 10
-        self["DayHiTempExtraTemp6"] = self["DayHiTempExtraTemp6"] / 10
-        self["DayHiTempExtraTemp7"] = self["DayHiTempExtraTemp7"] / 10
-        self["DayHiTempExtraTemp8"] = self["DayHiTempExtraTemp8"] / 10
-        self["DayHiTempSoil1"] = self["DayHiTempSoil1"] / 10
-        self["DayHiTempSoil2"] = self["DayHiTempSoil2"] / 10
-        self["DayHiTempSoil3"] = self["DayHiTempSoil3"] / 10
-        self["DayHiTempSoil4"] = self["DayHiTempSoil4"] / 10
-        self["DayHiTempLeaf1"] = self["DayHiTempLeaf1"] / 10
-        self["DayHiTempLeaf2"] = self["DayHiTempLeaf2"] / 10
-        self["DayHiTempLeaf3"] = self["DayHiTempLeaf3"] / 10
-        self["DayHiTempLeaf4"] = self["DayHiTempLeaf4"] / 10
-        self["TimeDayLowTempExtraTemp2"] = self.unpack_time(
-            self["TimeDayLowTempExtraTemp2"]
-        )
-        self["TimeDayLowTempExtraTemp3"] = self.unpack_time(
-            self["TimeDayLowTempExtraTemp3"]
-        )
-        self["TimeDayLowTempExtraTemp4"] = self.unpack_time(
-            self["TimeDayLowTempExtraTemp4"]
-        )
-        self["TimeDayLowTempExtraTemp5"] = self.unpack_time(
-            self["TimeDayLowTempExtraTemp5"]
-        )
-        self["TimeDayLowTempExtraTemp6"] = self.unpack_time(
-            self["TimeDayLowTempExtraTemp6"]
-        )
-        self["TimeDayLowTempExtraTemp7"] = self.unpack_time(
-            self["TimeDayLowTempExtraTemp7"]
-        )
-        self["TimeDayLowTempExtraTemp8"] = self.unpack_time(
-            self["TimeDayLowTempExtraTemp8"]
-        )
-        self["TimeDayLowTempSoil1"] = self.unpack_time(self["TimeDayLowTempSoil1"])
-        self["TimeDayLowTempSoil2"] = self.unpack_time(self["TimeDayLowTempSoil2"])
-        self["TimeDayLowTempSoil3"] = self.unpack_time(self["TimeDayLowTempSoil3"])
-        self["TimeDayLowTempSoil4"] = self.unpack_time(self["TimeDayLowTempSoil4"])
-        self["TimeDayLowTempLeaf1"] = self.unpack_time(self["TimeDayLowTempLeaf1"])
-        self["TimeDayLowTempLeaf2"] = self.unpack_time(self["TimeDayLowTempLeaf2"])
-        self["TimeDayLowTempLeaf3"] = self.unpack_time(self["TimeDayLowTempLeaf3"])
-        self["TimeDayLowTempLeaf4"] = self.unpack_time(self["TimeDayLowTempLeaf4"])
-        self["TimeDayHiTempExtraTemp2"] = self.unpack_time(
-            self["TimeDayHiTempExtraTemp2"]
-        )
-        self["TimeDayHiTempExtraTemp3"] = self.unpack_time(
-            self["TimeDayHiTempExtraTemp3"]
-        )
-        self["TimeDayHiTempExtraTemp4"] = self.unpack_time(
-            self["TimeDayHiTempExtraTemp4"]
-        )
-        self["TimeDayHiTempExtraTemp5"] = self.unpack_time(
-            self["TimeDayHiTempExtraTemp5"]
-        )
-        self["TimeDayHiTempExtraTemp6"] = self.unpack_time(
-            self["TimeDayHiTempExtraTemp6"]
-        )
-        self["TimeDayHiTempExtraTemp7"] = self.unpack_time(
-            self["TimeDayHiTempExtraTemp7"]
-        )
-        self["TimeDayHiTempExtraTemp8"] = self.unpack_time(
-            self["TimeDayHiTempExtraTemp8"]
-        )
-        self["TimeDayHiTempSoil1"] = self.unpack_time(self["TimeDayHiTempSoil1"])
-        self["TimeDayHiTempSoil2"] = self.unpack_time(self["TimeDayHiTempSoil2"])
-        self["TimeDayHiTempSoil3"] = self.unpack_time(self["TimeDayHiTempSoil3"])
-        self["TimeDayHiTempSoil4"] = self.unpack_time(self["TimeDayHiTempSoil4"])
-        self["TimeDayHiTempLeaf1"] = self.unpack_time(self["TimeDayHiTempLeaf1"])
-        self["TimeDayHiTempLeaf2"] = self.unpack_time(self["TimeDayHiTempLeaf2"])
-        self["TimeDayHiTempLeaf3"] = self.unpack_time(self["TimeDayHiTempLeaf3"])
-        self["TimeDayHiTempLeaf4"] = self.unpack_time(self["TimeDayHiTempLeaf4"])
-        self["MonthHiTempExtraTemp2"] = self["MonthHiTempExtraTemp2"] / 10
-        self["MonthHiTempExtraTemp3"] = self["MonthHiTempExtraTemp3"] / 10
-        self["MonthHiTempExtraTemp4"] = self["MonthHiTempExtraTemp4"] / 10
-        self["MonthHiTempExtraTemp5"] = self["MonthHiTempExtraTemp5"] / 10
-        self["MonthHiTempExtraTemp6"] = self["MonthHiTempExtraTemp6"] / 10
-        self["MonthHiTempExtraTemp7"] = self["MonthHiTempExtraTemp7"] / 10
-        self["MonthHiTempExtraTemp8"] = self["MonthHiTempExtraTemp8"] / 10
-        self["MonthHiTempSoil1"] = self["MonthHiTempSoil1"] / 10
-        self["MonthHiTempSoil2"] = self["MonthHiTempSoil2"] / 10
-        self["MonthHiTempSoil3"] = self["MonthHiTempSoil3"] / 10
-        self["MonthHiTempSoil4"] = self["MonthHiTempSoil4"] / 10
-        self["MonthHiTempLeaf1"] = self["MonthHiTempLeaf1"] / 10
-        self["MonthHiTempLeaf2"] = self["MonthHiTempLeaf2"] / 10
-        self["MonthHiTempLeaf3"] = self["MonthHiTempLeaf3"] / 10
-        self["MonthHiTempLeaf4"] = self["MonthHiTempLeaf4"] / 10
-        self["MonthLowTempExtraTemp2"] = self["MonthLowTempExtraTemp2"] / 10
-        self["MonthLowTempExtraTemp3"] = self["MonthLowTempExtraTemp3"] / 10
-        self["MonthLowTempExtraTemp4"] = self["MonthLowTempExtraTemp4"] / 10
-        self["MonthLowTempExtraTemp5"] = self["MonthLowTempExtraTemp5"] / 10
-        self["MonthLowTempExtraTemp6"] = self["MonthLowTempExtraTemp6"] / 10
-        self["MonthLowTempExtraTemp7"] = self["MonthLowTempExtraTemp7"] / 10
-        self["MonthLowTempExtraTemp8"] = self["MonthLowTempExtraTemp8"] / 10
-        self["MonthLowTempSoil1"] = self["MonthLowTempSoil1"] / 10
-        self["MonthLowTempSoil2"] = self["MonthLowTempSoil2"] / 10
-        self["MonthLowTempSoil3"] = self["MonthLowTempSoil3"] / 10
-        self["MonthLowTempSoil4"] = self["MonthLowTempSoil4"] / 10
-        self["MonthLowTempLeaf1"] = self["MonthLowTempLeaf1"] / 10
-        self["MonthLowTempLeaf2"] = self["MonthLowTempLeaf2"] / 10
-        self["MonthLowTempLeaf3"] = self["MonthLowTempLeaf3"] / 10
-        self["MonthLowTempLeaf4"] = self["MonthLowTempLeaf4"] / 10
-        self["YearHiTempExtraTemp2"] = self["YearHiTempExtraTemp2"] / 10
-        self["YearHiTempExtraTemp3"] = self["YearHiTempExtraTemp3"] / 10
-        self["YearHiTempExtraTemp4"] = self["YearHiTempExtraTemp4"] / 10
-        self["YearHiTempExtraTemp5"] = self["YearHiTempExtraTemp5"] / 10
-        self["YearHiTempExtraTemp6"] = self["YearHiTempExtraTemp6"] / 10
-        self["YearHiTempExtraTemp7"] = self["YearHiTempExtraTemp7"] / 10
-        self["YearHiTempExtraTemp8"] = self["YearHiTempExtraTemp8"] / 10
-        self["YearHiTempSoil1"] = self["YearHiTempSoil1"] / 10
-        self["YearHiTempSoil2"] = self["YearHiTempSoil2"] / 10
-        self["YearHiTempSoil3"] = self["YearHiTempSoil3"] / 10
-        self["YearHiTempSoil4"] = self["YearHiTempSoil4"] / 10
-        self["YearHiTempLeaf1"] = self["YearHiTempLeaf1"] / 10
-        self["YearHiTempLeaf2"] = self["YearHiTempLeaf2"] / 10
-        self["YearHiTempLeaf3"] = self["YearHiTempLeaf3"] / 10
-        self["YearHiTempLeaf4"] = self["YearHiTempLeaf4"] / 10
-        self["YearLowTempExtraTemp2"] = self["YearLowTempExtraTemp2"] / 10
-        self["YearLowTempExtraTemp3"] = self["YearLowTempExtraTemp3"] / 10
-        self["YearLowTempExtraTemp4"] = self["YearLowTempExtraTemp4"] / 10
-        self["YearLowTempExtraTemp5"] = self["YearLowTempExtraTemp5"] / 10
-        self["YearLowTempExtraTemp6"] = self["YearLowTempExtraTemp6"] / 10
-        self["YearLowTempExtraTemp7"] = self["YearLowTempExtraTemp7"] / 10
-        self["YearLowTempExtraTemp8"] = self["YearLowTempExtraTemp8"] / 10
-        self["YearLowTempSoil1"] = self["YearLowTempSoil1"] / 10
-        self["YearLowTempSoil2"] = self["YearLowTempSoil2"] / 10
-        self["YearLowTempSoil3"] = self["YearLowTempSoil3"] / 10
-        self["YearLowTempSoil4"] = self["YearLowTempSoil4"] / 10
-        self["YearLowTempLeaf1"] = self["YearLowTempLeaf1"] / 10
-        self["YearLowTempLeaf2"] = self["YearLowTempLeaf2"] / 10
-        self["YearLowTempLeaf3"] = self["YearLowTempLeaf3"] / 10
-        self["YearLowTempLeaf4"] = self["YearLowTempLeaf4"] / 10
-        self["TimeDayLowOutHum"] = self.unpack_time(self["TimeDayLowOutHum"])
-        self["TimeDayLowOutExtraHum2"] = self.unpack_time(
-            self["TimeDayLowOutExtraHum2"]
-        )
-        self["TimeDayLowOutExtraHum3"] = self.unpack_time(
-            self["TimeDayLowOutExtraHum3"]
-        )
-        self["TimeDayLowOutExtraHum4"] = self.unpack_time(
-            self["TimeDayLowOutExtraHum4"]
-        )
-        self["TimeDayLowOutExtraHum5"] = self.unpack_time(
-            self["TimeDayLowOutExtraHum5"]
-        )
-        self["TimeDayLowOutExtraHum6"] = self.unpack_time(
-            self["TimeDayLowOutExtraHum6"]
-        )
-        self["TimeDayLowOutExtraHum7"] = self.unpack_time(
-            self["TimeDayLowOutExtraHum7"]
-        )
-        self["TimeDayLowOutExtraHum8"] = self.unpack_time(
-            self["TimeDayLowOutExtraHum8"]
+    # Fields stored in tenths, hundredths, thousandths with their divisor
+    SCALES = (
+        # barometer
+        ("DailyLowBarometer", 1000),
+        ("DailyHighBarometer", 1000),
+        ("MonthlyLowBar", 1000),
+        ("MonthlyHighBar", 1000),
+        ("YearLowBarometer", 1000),
+        ("YearHighBarometer", 1000),
+        # inside temperature
+        ("DayHiInsideTemp", 10),
+        ("DayLowInsideTemp", 10),
+        ("MonthLowInTemp", 10),
+        ("MonthHiInTemp", 10),
+        ("YearLowInTemp", 10),
+        ("YearHiInTemp", 10),
+        # outside temperature
+        ("DayLowOutTemp", 10),
+        ("DayHiOutTemp", 10),
+        ("MonthHiOutTemp", 10),
+        ("MonthLowOutTemp", 10),
+        ("YearHiOutTemp", 10),
+        ("YearLowOutTemp", 10),
+        # rain rate
+        ("DayHighRainRate", 100),
+        ("HourHighRainRate", 100),
+        ("MonthHighRainRate", 100),
+        ("YearHighRainRate", 100),
+    ) + tuple(
+        # extra temperatures
+        (prefix + key, 10)
+        for prefix in (
+            "DayLowTemp",
+            "DayHiTemp",
+            "MonthHiTemp",
+            "MonthLowTemp",
+            "YearHiTemp",
+            "YearLowTemp",
         )
-        self["TimeDayHiOutHum"] = self.unpack_time(self["TimeDayHiOutHum"])
-        self["TimeDayHiOutExtraHum2"] = self.unpack_time(self["TimeDayHiOutExtraHum2"])
-        self["TimeDayHiOutExtraHum3"] = self.unpack_time(self["TimeDayHiOutExtraHum3"])
-        self["TimeDayHiOutExtraHum4"] = self.unpack_time(self["TimeDayHiOutExtraHum4"])
-        self["TimeDayHiOutExtraHum5"] = self.unpack_time(self["TimeDayHiOutExtraHum5"])
-        self["TimeDayHiOutExtraHum6"] = self.unpack_time(self["TimeDayHiOutExtraHum6"])
-        self["TimeDayHiOutExtraHum7"] = self.unpack_time(self["TimeDayHiOutExtraHum7"])
-        self["TimeDayHiOutExtraHum8"] = self.unpack_time(self["TimeDayHiOutExtraHum8"])
-        self["TimeDayHiLeafWetness1"] = self.unpack_time(self["TimeDayHiLeafWetness1"])
-        self["TimeDayHiLeafWetness2"] = self.unpack_time(self["TimeDayHiLeafWetness2"])
-        self["TimeDayHiLeafWetness3"] = self.unpack_time(self["TimeDayHiLeafWetness3"])
-        self["TimeDayHiLeafWetness4"] = self.unpack_time(self["TimeDayHiLeafWetness4"])
-        self["TimeDayLowLeafWetness1"] = self.unpack_time(
-            self["TimeDayLowLeafWetness1"]
+        for key in _HILOW_EXTRA_TEMP_KEYS
+    )
+
+    # Packed HHMM time fields, see `unpack_time`
+    TIME_FIELDS = (
+        (
+            "TimeOfDayLowBar",
+            "TimeOfDayHighBar",
+            "TimeOfHighWindSpeed",
+            "TimeDayHiInTemp",
+            "TimeDayLowInTemp",
+            "TimeDayHiInHum",
+            "TimeDayLowInHum",
+            "TimeDayLowOutTemp",
+            "TimeDayHiOutTemp",
+            "TimeDayLowDewPoint",
+            "TimeDayHiDewPoint",
+            "TimeDayLowChill",
+            "TimeofDayHighHeat",
+            "TimeofDayHighTHSW",
+            "TimeofDayHighSolar",
+            "TimeofDayHighUV",
+            "TimeofDayHighRainRate",
         )
-        self["TimeDayLowLeafWetness2"] = self.unpack_time(
-            self["TimeDayLowLeafWetness2"]
+        + tuple(
+            prefix + key
+            for prefix in ("TimeDayLowTemp", "TimeDayHiTemp")
+            for key in _HILOW_EXTRA_TEMP_KEYS
         )
-        self["TimeDayLowLeafWetness3"] = self.unpack_time(
-            self["TimeDayLowLeafWetness3"]
+        + tuple(
+            prefix + key
+            for prefix in ("TimeDayLowOut", "TimeDayHiOut")
+            for key in ["Hum"] + [f"ExtraHum{i}" for i in range(2, 9)]
         )
-        self["TimeDayLowLeafWetness4"] = self.unpack_time(
-            self["TimeDayLowLeafWetness4"]
+        + tuple(
+            f"{prefix}{i}"
+            for prefix in ("TimeDayHiLeafWetness", "TimeDayLowLeafWetness")
+            for i in range(1, 5)
         )
+    )
 
-    def unpack_time(self, time):
-        """Given a packed time field, unpack and return "HH:MM" string."""
+    def __init__(self, data) -> None:
+        """Initalize."""
+
+        super().__init__(data, self.LOOP_FORMAT)
+        for key, divisor in self.SCALES:
+            self[key] = self[key] / divisor
+        # the times are all given for the current date
+        date = datetime.now().date()
+        for key in self.TIME_FIELDS:
+            self[key] = self.unpack_time(self[key], date)
+
+    def unpack_time(self, time, date=None):
+        """Given a packed time field, unpack and return the datetime at this time of `date` (today by default)."""
 
         if time == 65535:
             return None
 
-        # format: HHMM, and space padded on the left.ex: "601" is 6:01 AM
+        if date is None:
+            date = datetime.now().date()
         timezone = ZoneInfo("America/New_York")
-        date_format = "%Y-%m-%d %H:%M"
-
-        time = "%02d:%02d" % divmod(time, 100)  # covert to "06:01"  # noqa: UP031
-        date = datetime.now().date().strftime("%Y-%m-%d")
-        datetime_object = datetime.strptime(date + " " + time, date_format)
-        return datetime_object.replace(tzinfo=timezone)
+        # format: HHMM, and space padded on the left.ex: "601" is 6:01 AM
+        hour, minute = divmod(time, 100)
+        return datetime(
+            date.year, date.month, date.day, hour, minute, tzinfo=timezone
+        )
 
 
 class ArchiveDataParserRevB(DataParser):
@@ -1189,10 +1126,23 @@ class ArchiveDataParserRevB(DataParser):
         ("SoilMoist", "4s"),
     )
 
-    def __init__(self, data) -> None:
+    # Byte arrays, in key order, temperatures are stored with a +90 offset
+    ARRAY_FIELDS = _array_fields(
+        ("SoilTemps", 90, 4),
+        ("LeafTemps", 90, 2),
+        ("ExtraTemps", 90, 3),
+        ("SoilMoist", 0, 4),
+        ("LeafWetness", 0, 2),
+        ("ExtraHum", 0, 2),
+    )
+
+    # A DMP page holds 5 archive records of 52 bytes each
+    RECORD_STRUCT = _compile_format(ARCHIVE_FORMAT)[1]
+
+    def __init__(self, data, values=None) -> None:
         """Initalize."""
 
-        super().__init__(data, self.ARCHIVE_FORMAT)
+        super().__init__(data, self.ARCHIVE_FORMAT, values=values)
         self["raw_datestamp"] = bytes_to_binary(self.raw_bytes[0:4])
         self["Datetime"] = unpack_dmp_date_time(self["DateStamp"], self["TimeStamp"])
         del self["DateStamp"]
@@ -1204,21 +1154,22 @@ class ArchiveDataParserRevB(DataParser):
         self["TempIn"] = self["TempIn"] / 10
         self["UV"] = self["UV"] / 10
         self["ETHour"] = self["ETHour"] / 1000
-        SoilTempsValues = struct.unpack(b"4B", self["SoilTemps"])
-        self["SoilTemps"] = tuple((t - 90) for t in SoilTempsValues)
-        self["ExtraHum"] = struct.unpack(b"2B", self["ExtraHum"])
-        self["SoilMoist"] = struct.unpack(b"4B", self["SoilMoist"])
-        LeafTempsValues = struct.unpack(b"2B", self["LeafTemps"])
-        self["LeafTemps"] = tuple((t - 90) for t in LeafTempsValues)
-        self["LeafWetness"] = struct.unpack(b"2B", self["LeafWetness"])
-        ExtraTempsValues = struct.unpack(b"3B", self["ExtraTemps"])
-        self["ExtraTemps"] = tuple((t - 90) for t in ExtraTempsValues)
-        self.tuple_to_dict("SoilTemps")
-        self.tuple_to_dict("LeafTemps")
-        self.tuple_to_dict("ExtraTemps")
-        self.tuple_to_dict("SoilMoist")
-        self.tuple_to_dict("LeafWetness")
-        self.tuple_to_dict("ExtraHum")
+        self.expand_arrays()
+
+    @classmethod
+    def unpack_page(cls, records):
+        """Unpack the archive records of a DMP page `Records` block at once.
+
+        Returns a list of `(raw_record, values)` pairs, `values` starting
+        with the `DateStamp` and `TimeStamp` fields so that the record
+        datetime is known before the record is parsed.
+        """
+
+        size = cls.RECORD_STRUCT.size
+        return [
+            (records[i * size : (i + 1) * size], values)
+            for i, values in enumerate(cls.RECORD_STRUCT.iter_unpack(records))
+        ]
 
 
 class DmpHeaderParser(DataParser):
@@ -1254,29 +1205,29 @@ class DmpPageParser(DataParser):
 
 def pack_dmp_date_time(d):
     """Pack `datetime` to DateStamp and TimeStamp VantagePro2 with CRC."""
-    vpdate = d.day + d.month * 32 + (d.year - 2000) * 512
+    vpdate = d.day | (d.month << 5) | ((d.year - 2000) << 9)
     vptime = 100 * d.hour + d.minute
-    data = struct.pack(b"HH", vpdate, vptime)
+    data = _DMP_DATE_TIME_STRUCT.pack(vpdate, vptime)
     return VantageProCRC(data).data_with_checksum
 
 
 def unpack_dmp_date_time(date, time):
     """Unpack `date` and `time` to datetime."""
 
-    if date != 0xFFFF and time != 0xFFFF:
-        day = date & 0x1F  # 5 bits
-        month = (date >> 5) & 0x0F  # 4 bits
-        year = ((date >> 9) & 0x7F) + 2000  # 7 bits
-        hour, min_ = divmod(time, 100)
-        return datetime(year, month, day, hour, min_)
-    return None
+    # empty archive records are filled with 0xFF
+    if date == 0xFFFF or time == 0xFFFF:
+        return None
+    day = date & 0x1F  # 5 bits
+    month = (date >> 5) & 0x0F  # 4 bits
+    year = ((date >> 9) & 0x7F) + 2000  # 7 bits
+    hour, min_ = divmod(time, 100)
+    return datetime(year, month, day, hour, min_)
 
 
 def pack_datetime(dtime):
     """Returns packed `dtime` with CRC."""
 
-    data = struct.pack(
-        b">BBBBBB",
+    data = _DATETIME_STRUCT.pack(
         dtime.second,
         dtime.minute,
         dtime.hour,
@@ -1291,5 +1242,5 @@ def unpack_datetime(data):
     """Return unpacked datetime `data` and check CRC."""
 
     VantageProCRC(data).check()
-    s, m, h, day, month, year = struct.unpack(b">BBBBBB", data[:6])
+    s, m, h, day, month, year = data[:6]
     return datetime(year + 1900, month, day, h, m, s)
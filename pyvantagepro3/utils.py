@@ -1,9 +1,9 @@
 """pyvantagepro2.utils------------------."""
 
 import binascii
-from collections import OrderedDict
 import csv
 from io import StringIO
+from operator import itemgetter
 import time
 from warnings import warn
 
@@ -23,9 +23,9 @@ def is_text(data):
 
 
 def is_bytes(data):
-    """Check if data is bytes instance."""
+    """Check if data is a bytes-like instance."""
 
-    return isinstance(data, bytes)
+    return isinstance(data, (bytes, bytearray, memoryview))
 
 
 class cached_property:
@@ -112,11 +112,7 @@ class retry:
 
 def bytes_to_hex(byte):
     """Convert a bytearray to it's hex string representation."""
-    hexstr = str(binascii.hexlify(byte), "utf-8")
-    data = []
-    for i in range(0, len(hexstr), 2):
-        data.append(f"{hexstr[i : i + 2].upper()}")  # noqa: PERF401
-    return " ".join(data)
+    return bytes(byte).hex(" ").upper()
 
 
 def hex_to_bytes(hexstr):
@@ -140,14 +136,12 @@ def bytes_to_binary(values):
 
     E.g.
     >>> bytes_to_binary(b"\x4a\xff")
-    '0100101011111111'.
+    '0100101011111111'
     """
 
-    if values == 0:
-        data = "00000000"
-    else:
-        data = "".join([byte_to_binary(b) for b in values])
-    return data
+    if len(values) == 0:
+        return ""
+    return format(int.from_bytes(values, "big"), f"0{len(values) * 8}b")
 
 
 def hex_to_binary(hexstr):
@@ -198,17 +192,16 @@ def dict_to_csv(items, delimiter, header):
             output, fieldnames=items[0].keys(), delimiter=delimiter
         )
         if header:
-            csvwriter.writerow({key: key for key in items[0]})
+            csvwriter.writeheader()
 
-        for item in items:
-            csvwriter.writerow(dict(item))
+        csvwriter.writerows(items)
 
         content = output.getvalue()
         output.close()
     return content
 
 
-class Dict(OrderedDict):
+class Dict(dict):
     """A dict with somes additional methods."""
 
     def filter(self, keys):
@@ -256,5 +249,4 @@ class ListDict(list):
 
     def sorted_by(self, keyword, reverse=False):
         """Returns list sorted by `keyword`."""
-        key_ = keyword
-        return ListDict(sorted(self, key=lambda k: k[key_], reverse=reverse))
+        return ListDict(sorted(self, key=itemgetter(keyword), reverse=reverse))
@@ -35,6 +35,7 @@ setup(
         'Topic :: Software Development :: Libraries :: Python Modules'
     ],
     packages=find_packages(),
+    python_requires='>=3.10',
     zip_safe=False,
     install_requires=[],
     entry_points={